@@ -1,4 +1,38 @@
-import os, json
+import os, json, math
+
+try:
+    import orjson  # optional, faster encoding for save_to_json
+except ImportError:
+    orjson = None
+
+
+def _has_nonfinite(obj):
+    """True if obj holds a NaN/Infinity float, which orjson would write as null."""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_nonfinite(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_nonfinite(v) for v in obj)
+    return False
+
+
+def _dumps(data, indent):
+    """
+    Encode data to JSON bytes, with orjson when it can honour indent.
+
+    orjson only writes compact or 2-space output, so the default indent=4
+    always uses json. For indent=None/2 the NaN/Infinity pre-scan is a
+    Python walk over the data, which eats part of orjson's speedup on
+    small configs; the gain is on large, mostly-string/list configs.
+    """
+    # orjson has no NaN/Infinity (it would write null)
+    if orjson is not None and indent in (None, 2) and not _has_nonfinite(data):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+        except TypeError:
+            pass  # types orjson rejects (e.g. float subclasses, big ints) go through json
+    return json.dumps(data, indent=indent).encode()
 
 
 class Configs:
@@ -9,28 +43,23 @@ class Configs:
     def add_param(self, key, value):
         setattr(self, key, value)
 
-    def save_to_json(self, filepath):
-
-        # function to check if value is tuple then return a dict
-        def convert(obj):
-            if isinstance(obj, tuple):
-                return {"__tuple__": True, "items": list(obj)}
-            # elif isinstance(obj, nn.Module):
-            #     obj = str(obj)
-            # elif isinstance(obj, torch.device):
-            #     obj = str(obj)
-            return obj
+    def save_to_json(self, filepath, indent=4):
 
-        # add nested dict for tuple values
-        data = {key: convert(value) for key, value in self.__dict__.items()}
+        # add nested dict for tuple values, everything else is passed through
+        data = {
+            key: {"__tuple__": True, "items": list(value)}
+            if isinstance(value, tuple)
+            else value
+            for key, value in self.__dict__.items()
+        }
 
         if filepath.endswith(".json"):
             os.makedirs(os.path.dirname(filepath), exist_ok=True)
         else:
             os.makedirs(filepath, exist_ok=True)
             filepath = os.path.join(filepath, "config.json")
-        with open(filepath, "w") as f:
-            json.dump(data, f, indent=4)
+        with open(filepath, "wb") as f:
+            f.write(_dumps(data, indent))
             print(f"Config file save at : {filepath}")
 
     def load_from_json(self, file_path):
@@ -41,7 +70,8 @@ class Configs:
                 return tuple(obj["items"])
             return obj
 
-        # open data with tuple converter
+        # open data with tuple converter; json (not orjson) decodes, since
+        # orjson turns ints beyond 64 bits into floats and rejects NaN/Infinity
         with open(file_path, "r") as file:
             params = json.load(file, object_hook=custom_decoder)
 
@@ -4,23 +4,58 @@ from natsort import natsorted
 # --------------------------------------------------------------------
 
 
+def iter_filepaths_bytype(
+    target_path: str,
+    filetype: str | tuple,
+    exclude_hidden: bool = True,
+):
+    """
+    Yield paths from a directory with spesific file type(s), unsorted.
+
+    `filetype` is a literal, case-sensitive filename suffix (e.g. ".tif" or
+    "_mask.tif"), or a sequence of them. Glob patterns are not supported.
+
+    """
+    if not isinstance(filetype, str):
+        filetype = tuple(filetype)  # str.endswith checks a tuple in one call
+    for suffix in (filetype,) if isinstance(filetype, str) else filetype:
+        if any(c in suffix for c in "*?["):
+            raise ValueError(
+                f"filetype must be a literal suffix, got glob pattern {suffix!r}"
+            )
+    return _scan_filepaths(target_path, filetype, exclude_hidden)
+
+
+def _scan_filepaths(target_path, filetype, exclude_hidden):
+    """Generator behind iter_filepaths_bytype, so argument errors raise eagerly."""
+    with os.scandir(target_path) as it:
+        for e in it:
+            name = e.name
+            if (exclude_hidden and name[0:1] == ".") or not name.endswith(filetype):
+                continue
+            yield e.path
+
+
+# --------------------------------------------------------------------
+
+
 def get_filepaths_bytype(
     target_path: str,
-    filetype: str,
+    filetype: str | tuple,
     exclude_hidden: bool = True,
     make_string: bool = True,
     verbose: bool = True,
 ) -> list:
     """
-    Get paths from a directory with spesific file type.
+    Get paths from a directory with spesific file type(s).
+
+    `filetype` is a literal, case-sensitive filename suffix, or a sequence of
+    them (see iter_filepaths_bytype).
 
     """
-    target_path = pathlib.Path(target_path)
-    paths = list(target_path.glob(f"*{filetype}"))
-    if exclude_hidden:
-        paths = [p for p in paths if not os.path.basename(p).startswith(".")]
-    if make_string:
-        paths = [str(p) for p in paths]
+    paths = iter_filepaths_bytype(target_path, filetype, exclude_hidden)
+    if not make_string:
+        paths = map(pathlib.Path, paths)
     paths = natsorted(paths)
     if verbose == True:
         print(f"Total paths: {len(paths)}")
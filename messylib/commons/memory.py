@@ -1,17 +1,54 @@
 import psutil
+import gc
 import os
 import sys
-from pympler import asizeof
+import time
+from types import FunctionType, ModuleType
 
 _process = psutil.Process(os.getpid())
 
+# [timestamp, rss] of the last memory_info() read
+_cache = [float("-inf"), 0.0]
 
-def log_memory(tag=""):
-    """Log total memory usage of the current Python process."""
-    mem_in_mb = _process.memory_info().rss / 1024**2
+
+def log_memory(tag="", max_age=0.0):
+    """
+    Log total memory usage of the current Python process.
+
+    Parameters:
+    - tag: Optional prefix for the printed line
+    - max_age: Seconds a previous RSS reading may be reused for, e.g. 0.05
+      in tight logging loops. The default 0.0 always reads a fresh value.
+    """
+    now = time.monotonic()
+    if now - _cache[0] >= max_age:
+        _cache[:] = [now, _process.memory_info().rss]
+    mem_in_mb = _cache[1] / 1024**2
     print(f"{tag} Memory usage: {mem_in_mb:.2f} MB")
 
 
+# shared objects that should not be counted as part of a variable's size
+_SKIP_TYPES = (type, ModuleType, FunctionType)
+
+
+def _deep_size(obj):
+    """Sum sys.getsizeof over every object reachable from obj, counting each once."""
+    if isinstance(obj, _SKIP_TYPES):
+        return sys.getsizeof(obj)
+    seen = set()
+    stack = [obj]
+    total = 0
+    while stack:
+        o = stack.pop()
+        i = id(o)
+        if i in seen or isinstance(o, _SKIP_TYPES):
+            continue
+        seen.add(i)
+        total += sys.getsizeof(o)
+        stack.extend(gc.get_referents(o))
+    return total
+
+
 def sizeof(var, name=None, deep=False):
     """
     Print memory size of a single variable.
@@ -19,11 +56,11 @@ def sizeof(var, name=None, deep=False):
     Parameters:
     - var: The variable to inspect
     - name: Optional name to display
-    - deep: If True, calculate deep memory with pympler (slower but accurate)
+    - deep: If True, include every object referenced by var (slower)
     """
     label = name or repr(var)[:30]
     if deep:
-        size = asizeof.asizeof(var)
+        size = _deep_size(var)
     else:
         size = sys.getsizeof(var)
 
@@ -0,0 +1,7 @@
+import os
+
+# Set MESSYLIB_MPL_AGG=1 to use the non-interactive Agg backend when only saving plots
+if os.environ.get("MESSYLIB_MPL_AGG", "").lower() in ("1", "true", "yes"):
+    import matplotlib
+
+    matplotlib.use("Agg", force=False)
@@ -0,0 +1,63 @@
+import functools
+import matplotlib.pyplot as plt
+import seaborn as sns
+
+_VECTOR_EXTS = (".pdf", ".svg", ".eps", ".ps")
+
+
+def rasterize_long_lines(fname, min_points: int = 1000) -> None:
+    """
+    Rasterize long lines on the current figure when saving to a vector format.
+
+    Lines with at least `min_points` points are emitted as one embedded image
+    instead of a vector path per point; text, axes and short lines stay vector.
+    """
+    if not str(fname).lower().endswith(_VECTOR_EXTS):
+        return
+    for ax in plt.gcf().axes:
+        for line in ax.get_lines():
+            if len(line.get_xdata()) >= min_points:
+                line.set_rasterized(True)
+
+
+def png_save_kwargs(fname) -> dict:
+    """Extra plt.savefig kwargs that shrink PNG output; empty for other formats."""
+    if str(fname).lower().endswith(".png"):
+        # optimize implies zlib level 9, so a compress_level would be ignored
+        return {"pil_kwargs": {"optimize": True}}
+    return {}
+
+
+@functools.lru_cache(maxsize=64)
+def _named_palette(name: str, n_colors: int) -> tuple:
+    return tuple(sns.color_palette(name, n_colors=n_colors))
+
+
+def color_palette(name, n_colors: int) -> list:
+    """
+    sns.color_palette with results cached for named palettes.
+
+    Anything other than a palette name (e.g. None, which follows the current
+    colour cycle) is passed straight to seaborn uncached.
+    """
+    if isinstance(name, str):
+        return list(_named_palette(name, n_colors))
+    return sns.color_palette(name, n_colors=n_colors)
+
+
+# (style, font_scale) last applied through set_theme_once
+_current_theme = None
+
+
+def set_theme_once(style: str | None = None, font_scale: float = 1) -> None:
+    """
+    sns.set_theme, skipped if the same style and font scale were last applied.
+
+    rcParams changed elsewhere (e.g. plt.style.use) are not tracked, so call
+    sns.set_theme directly to force a reset after such changes.
+    """
+    global _current_theme
+    theme = (style, font_scale)
+    if theme != _current_theme:
+        sns.set_theme(style=style, font_scale=font_scale)
+        _current_theme = theme
@@ -1,6 +1,7 @@
 import pandas as pd
 import seaborn as sns
 import matplotlib.pyplot as plt
+from ._utils import png_save_kwargs, set_theme_once
 
 
 def plot_bubble(
@@ -23,15 +24,15 @@ def plot_bubble(
     tight_layout: bool = False,
     savepath=None,
     showplot: bool = True,
+    save_dpi: int = 150,
 ):
 
-    bubble_df = df.groupby(groupby).size().reset_index(name="Count")
+    bubble_df = df.groupby(groupby, observed=True).size().reset_index(name="Count")
     if sort_col is not None:
         bubble_df = bubble_df.sort_values(by=sort_col).reset_index()
 
     plt.figure(figsize=figsize)
-    sns.set_theme()
-    sns.set_style(sns_style)
+    set_theme_once(style=sns_style)
     sns.despine()
 
     bubble_plot = sns.scatterplot(
@@ -65,7 +66,9 @@ def plot_bubble(
     if tight_layout:
         plt.tight_layout()
     if savepath is not None:
-        plt.savefig(savepath, bbox_inches="tight")
+        plt.savefig(
+            savepath, bbox_inches="tight", dpi=save_dpi, **png_save_kwargs(savepath)
+        )
     if showplot:
         plt.show()
     plt.close()
@@ -1,8 +1,27 @@
+import numbers
 import numpy as np
 import matplotlib.pyplot as plt
 import pandas as pd
 import seaborn as sns
 from typing import Optional
+from ._utils import color_palette, set_theme_once
+
+
+def _countplot_order(col: pd.Series) -> list:
+    """
+    Level order sns.countplot uses for col (mirrors seaborn's categorical_order).
+
+    Categorical columns keep their categories, numeric values are sorted and
+    anything else keeps its order of first appearance.
+    """
+    if isinstance(col.dtype, pd.CategoricalDtype):
+        return list(col.cat.categories)
+    values = pd.unique(col.dropna())
+    if pd.api.types.is_numeric_dtype(col) or all(
+        isinstance(v, numbers.Number) for v in values
+    ):
+        return sorted(values)
+    return list(values)
 
 
 def plot_df(
@@ -50,15 +69,34 @@ def plot_df(
         fname (str): If given, save the plot to this file path.
         savedpi (int): DPI for saving the plot.
     """
-    sns.set_theme(style=style, font_scale=font_scale)
+    set_theme_once(style=style, font_scale=font_scale)
+
+    # Count once here and hand seaborn the aggregated table
+    group_cols = [x_col, color_col] if color_col else [x_col]
+    counts = df.groupby(group_cols, observed=True).size().reset_index(name="n")
 
     if isinstance(palette, str):
-        n_colors = df[color_col].nunique() if color_col else df[x_col].nunique()
-        palette = sns.color_palette(palette, n_colors=n_colors)
+        n_colors = counts[color_col].nunique() if color_col else len(counts)
+        palette = color_palette(palette, n_colors)
+
+    # barplot on the grouped table would not see the raw values, so pin the
+    # x/hue order countplot derived from them
+    if order is None:
+        order = _countplot_order(df[x_col])
+    hue_order = _countplot_order(df[color_col]) if color_col else None
 
     plt.figure(figsize=figsize)
 
-    ax = sns.countplot(data=df, x=x_col, hue=color_col, palette=palette, order=order)
+    ax = sns.barplot(
+        data=counts,
+        x=x_col,
+        y="n",
+        hue=color_col,
+        palette=palette,
+        order=order,
+        hue_order=hue_order,
+        errorbar=None,
+    )
 
     plt.title(title)
     plt.xlabel(xlabel)
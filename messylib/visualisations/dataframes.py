@@ -4,6 +4,39 @@ import matplotlib.pyplot as plt
 from typing import Sequence
 import numpy as np
 import matplotlib.ticker as ticker
+from ._utils import (
+    color_palette,
+    png_save_kwargs,
+    rasterize_long_lines,
+    set_theme_once,
+)
+
+
+def _melt_metrics(df: pd.DataFrame, id_vars: list, y_cols: Sequence[str]) -> pd.DataFrame:
+    """Melt y_cols into 'Metric'/'Value' columns using compact dtypes."""
+    melted_df = df[id_vars + list(y_cols)].melt(
+        id_vars=id_vars, value_vars=y_cols, var_name="Metric", value_name="Value"
+    )
+    melted_df["Value"] = pd.to_numeric(melted_df["Value"], downcast="float")
+
+    # Categories are given explicitly (in first-seen order) because a plain
+    # astype("category") sorts them and would reorder the seaborn hue/x axes
+    melted_df["Metric"] = pd.Categorical(
+        melted_df["Metric"], categories=list(dict.fromkeys(y_cols))
+    )
+    for col in id_vars:
+        if melted_df[col].dtype == object:
+            melted_df[col] = pd.Categorical(
+                melted_df[col], categories=melted_df[col].dropna().unique()
+            )
+    return melted_df
+
+
+def _is_strictly_increasing(arr: np.ndarray) -> bool:
+    """True for numeric/datetime arrays whose values are unique and ascending."""
+    if arr.dtype.kind not in "iufmM":
+        return False
+    return bool(np.all(arr[1:] > arr[:-1]))
 
 
 def plot_df_cols(
@@ -40,32 +73,35 @@ def plot_df_cols(
     x_tick_rotation: float = 0,
 ) -> None:
 
-    plot_df = df.copy()
-    
-    # 1. Handle X-axis and Melting
-    if x is None:
-        plot_df = plot_df.reset_index()
+    # 1. Handle X-axis and Melting (nothing below mutates df, so no copy needed)
+    x_from_index = x is None
+    plot_df = df
+    if x_from_index:
         x = "index"
+        if plot_type in ("bar", "box"):
+            # only the plotted columns are materialised alongside the index
+            used_cols = list(y_cols) + ([hue] if hue and hue not in y_cols else [])
+            plot_df = df[used_cols].reset_index()
 
     id_vars = [x]
     if hue and hue != x:
         id_vars.append(hue)
 
-    melted_df = plot_df.melt(
-        id_vars=id_vars, value_vars=y_cols, var_name="Metric", value_name="Value"
-    )
+    # Line plots read the wide frame directly; only bar/box need long format
+    if plot_type in ("bar", "box"):
+        melted_df = _melt_metrics(plot_df, id_vars, y_cols)
 
     # 2. Setup Figure and Style
     plt.figure(figsize=figsize)
     if seaborn_style:
-        sns.set(style=seaborn_style)
+        set_theme_once(style=seaborn_style)
 
     ax = plt.gca()
     
     # Determine palette logic
     actual_hue = hue if hue else "Metric"
     num_colors = len(plot_df[hue].unique()) if hue else len(y_cols)
-    palette = colors if isinstance(colors, list) else sns.color_palette(colors, n_colors=num_colors)
+    palette = colors if isinstance(colors, list) else color_palette(colors, num_colors)
 
     # 3. Plot Execution
     if plot_type == "bar":
@@ -77,16 +113,27 @@ def plot_df_cols(
                     showfliers=showfliers, linewidth=box_linewidth, ax=ax)
     
     else: # Default to line
-        unique_metrics = melted_df["Metric"].unique()
-        for i, metric in enumerate(unique_metrics):
-            subset = melted_df[melted_df["Metric"] == metric]
+        # Draw straight from the wide columns, no long-format intermediate.
+        # ax.plot joins rows in frame order, so it is only used when x is unique
+        # and sorted; otherwise sns.lineplot sorts and averages repeated x values.
+        x_arr = df.index.to_numpy() if x_from_index else plot_df[x].to_numpy()
+        direct = not hue and _is_strictly_increasing(x_arr)
+        for i, metric in enumerate(y_cols):
             style = line_styles[i] if line_styles and i < len(line_styles) else None
             marker = markers[i] if markers and i < len(markers) else None
-            sns.lineplot(
-                data=subset, x=x, y="Value", label=metric, ax=ax,
+            line_kws = dict(
+                label=metric,
                 color=palette[i] if not hue and i < len(palette) else None,
                 linewidth=line_width, linestyle=style, marker=marker, markersize=marker_size
             )
+            y_arr = plot_df[metric].to_numpy()
+            if direct:
+                # drop NaN rows like sns.lineplot does, so sparse metrics (e.g.
+                # val_loss every k epochs) still join up instead of breaking
+                valid = ~pd.isna(y_arr)
+                ax.plot(x_arr[valid], y_arr[valid], **line_kws)
+            else:
+                sns.lineplot(x=x_arr, y=y_arr, ax=ax, **line_kws)
 
     # 4. Formatting (Universal)
     ax.set_xlabel(xlabel if xlabel else x, fontsize=xlabel_fontsize)
@@ -103,16 +150,20 @@ def plot_df_cols(
 
     # Spine management
     if remove_spines:
-        for spine in remove_spines:
-            if spine in ax.spines: ax.spines[spine].set_visible(False)
+        for spine_name in remove_spines:
+            spine = ax.spines.get(spine_name)
+            if spine is not None: spine.set_visible(False)
 
     for spine_name in highlight_spines:
-        if spine_name in ax.spines:
-            ax.spines[spine_name].set_linewidth(highlight_spines_dict["linewidth"])
-            ax.spines[spine_name].set_color(highlight_spines_dict["color"])
+        spine = ax.spines.get(spine_name)
+        if spine is not None:
+            spine.update(highlight_spines_dict)
 
-    # Tick configuration
-    ax.tick_params(axis="y", labelsize=ylabel_fontsize)
+    # Tick configuration (a single call when both axes share the label size)
+    if x_tick_rotation == 0 and xlabel_fontsize == ylabel_fontsize:
+        ax.tick_params(axis="both", labelsize=ylabel_fontsize, rotation=0)
+    else:
+        ax.tick_params(axis="y", labelsize=ylabel_fontsize)
     ax.yaxis.set_minor_locator(ticker.AutoMinorLocator())
 
     if x_tick_rotation != 0:
@@ -122,7 +173,7 @@ def plot_df_cols(
             ha="right", 
             rotation_mode="anchor"
         )
-    else:
+    elif xlabel_fontsize != ylabel_fontsize:
         ax.tick_params(axis="x", labelsize=xlabel_fontsize, rotation=x_tick_rotation)
 
     # Legend Logic
@@ -138,7 +189,10 @@ def plot_df_cols(
         plt.tight_layout()
 
     if savedir:
-        plt.savefig(savedir, bbox_inches="tight", dpi=save_dpi)
+        rasterize_long_lines(savedir)
+        plt.savefig(
+            savedir, bbox_inches="tight", dpi=save_dpi, **png_save_kwargs(savedir)
+        )
 
     if show_plot: plt.show()
     else: plt.close()
@@ -150,7 +204,7 @@ def plot_df_cols(
 
 def boxplot_df_cols(
     df: pd.DataFrame,
-    x: str,
+    x: str | None,
     y_cols: Sequence[str],
     hue: str | None = None,
     colors: list[str] | str | dict | None = None,
@@ -182,8 +236,9 @@ def boxplot_df_cols(
     Args:
         df : pd.DataFrame
             DataFrame containing the data.
-        x : str
-            Main categorical variable on the x-axis.
+        x : str | None
+            Main categorical variable on the x-axis. If None, each column in
+            `y_cols` is drawn as its own box along the x-axis.
         y_cols : Sequence[str]
             Columns to plot as boxplots (melted and grouped by 'Metric').
         hue : str | None
@@ -221,7 +276,7 @@ def boxplot_df_cols(
         highlight_spines : Sequence[str]
             List of spines to make thick and black, e.g., ["left", "bottom"].
         highlight_spines_dict : dict
-            Highlighted spine line parameters.
+            Highlighted spine properties, e.g. {"linewidth": 1, "color": "black"}.
         showfliers : bool
             Whether to show outlier dots.
         show_legend : bool
@@ -234,23 +289,24 @@ def boxplot_df_cols(
     Returns:
         None
     """
-    # Create a copy of the DataFrame to avoid modifying the original
-    plot_df = df.copy()
+    # Without x or hue grouping every column is a single box, so skip the melt
+    # and let seaborn plot the wide frame
+    wide_mode = x is None and not hue
 
     # Melt data so all metrics go into a single 'Metric' column
-    id_vars = [x]
-    if hue and hue != x:  # <-- FIX: Only append if hue is different from x
-        id_vars.append(hue)
+    # (melt returns a new frame, so df itself is never modified)
+    if not wide_mode:
+        id_vars = [x] if x else []
+        if hue and hue != x:  # <-- FIX: Only append if hue is different from x
+            id_vars.append(hue)
 
-    melted_df = plot_df.melt(
-        id_vars=id_vars, value_vars=y_cols, var_name="Metric", value_name="Value"
-    )
+        melted_df = _melt_metrics(df, id_vars, y_cols)
 
     # Create the plot figure
     plt.figure(figsize=figsize)
     if seaborn_style:
         # Set the seaborn style if specified
-        sns.set(style=seaborn_style)
+        set_theme_once(style=seaborn_style)
 
     # Determine the color palette
     palette = None
@@ -261,25 +317,34 @@ def boxplot_df_cols(
         # we need colors for each metric in y_cols.
         # If hue is another column, we need colors for unique values in that hue column.
         if hue:
-            num_colors = len(plot_df[hue].unique()) if hue in plot_df else len(y_cols)
+            num_colors = len(df[hue].unique()) if hue in df else len(y_cols)
         else:
             num_colors = len(y_cols)
-        palette = sns.color_palette(colors, n_colors=num_colors)
+        palette = color_palette(colors, num_colors)
 
 
     # Create the boxplot
-    ax = sns.boxplot(
-        data=melted_df,
-        x=x,
-        y="Value",
-        hue=hue if hue else "Metric", # Use 'Metric' as hue if no specific hue is provided
-        palette=palette,
-        showfliers=showfliers,
-        linewidth=box_linewidth,
-    )
+    if wide_mode:
+        # seaborn draws a wide frame natively, one box per column
+        ax = sns.boxplot(
+            data=df[list(y_cols)],
+            palette=palette,
+            showfliers=showfliers,
+            linewidth=box_linewidth,
+        )
+    else:
+        ax = sns.boxplot(
+            data=melted_df,
+            x=x if x else "Metric",
+            y="Value",
+            hue=hue if hue else "Metric", # Use 'Metric' as hue if no specific hue is provided
+            palette=palette,
+            showfliers=showfliers,
+            linewidth=box_linewidth,
+        )
 
     # Set axis labels and title
-    ax.set_xlabel(xlabel if xlabel else x, fontsize=xlabel_fontsize)
+    ax.set_xlabel(xlabel if xlabel else (x or "Metric"), fontsize=xlabel_fontsize)
     ax.set_ylabel(ylabel if ylabel else "Value", fontsize=ylabel_fontsize)
 
     if title:
@@ -302,28 +367,30 @@ def boxplot_df_cols(
 
     # Remove specified spines
     if remove_spines:
-        for spine in remove_spines:
-            if spine in ax.spines:
-                ax.spines[spine].set_visible(False)
+        for spine_name in remove_spines:
+            spine = ax.spines.get(spine_name)
+            if spine is not None:
+                spine.set_visible(False)
 
-    # Highlight specified spines
+    # Highlight specified spines (applies every property in highlight_spines_dict)
     for spine_name in highlight_spines:
-        if spine_name in ax.spines:
-            ax.spines[spine_name].set_linewidth(highlight_spines_dict["linewidth"])
-            ax.spines[spine_name].set_color(highlight_spines_dict["color"])
+        spine = ax.spines.get(spine_name)
+        if spine is not None:
+            spine.update(highlight_spines_dict)
 
-    # Configure tick parameters
+    # Configure tick parameters (x only needs its own call if its size differs)
     ax.tick_params(
-        bottom="on",
-        left="on",
+        bottom=True,
+        left=True,
         axis="both",
         direction="out",
         length=5,
         width=1,
         colors="black",
+        labelsize=ylabel_fontsize,
     )
-    # <-- UPDATED: Added labelrotation here
-    ax.tick_params(axis="x", labelsize=xlabel_fontsize)
+    if xlabel_fontsize != ylabel_fontsize:
+        ax.tick_params(axis="x", labelsize=xlabel_fontsize)
     
     # Rotate and align x-axis labels from the end
     if x_tick_rotation != 0:
@@ -333,7 +400,6 @@ def boxplot_df_cols(
             ha="right", 
             rotation_mode="anchor"
         )
-    ax.tick_params(axis="y", labelsize=ylabel_fontsize)
 
     # Adjust the frequency of minor ticks (usually more relevant for y-axis in boxplots)
     # ax.xaxis.set_minor_locator(ticker.AutoMinorLocator()) # Often not needed for categorical x
@@ -344,7 +410,7 @@ def boxplot_df_cols(
         legend_title = None
         if hue:
             legend_title = hue
-        elif len(y_cols) > 1 : # Only show legend if there are multiple metrics when hue is not used
+        elif len(y_cols) > 1 and not wide_mode: # Only show legend if there are multiple metrics when hue is not used
              legend_title = "Metric"
 
         if legend_title: # Proceed only if there's something to show in legend
@@ -368,7 +434,9 @@ def boxplot_df_cols(
 
     # Save the figure if a directory is specified
     if savedir:
-        plt.savefig(savedir, bbox_inches="tight", dpi=save_dpi)
+        plt.savefig(
+            savedir, bbox_inches="tight", dpi=save_dpi, **png_save_kwargs(savedir)
+        )
 
     # Show or close the plot
     if show_plot:
@@ -2,6 +2,29 @@ import numpy as np
 import matplotlib.pyplot as plt
 from typing import Optional, List
 import seaborn as sns
+from ._utils import color_palette, rasterize_long_lines, set_theme_once
+
+try:
+    import numba  # optional, fuses the mean ± std band into one parallel loop
+except ImportError:
+    numba = None
+
+
+def _bands_numpy(mean: np.ndarray, std: np.ndarray):
+    """Lower and upper (mean ± std) band edges."""
+    return mean - std, mean + std
+
+
+if numba is not None:
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _bands(mean, std):
+        lo = np.empty_like(mean)
+        hi = np.empty_like(mean)
+        for i in numba.prange(mean.shape[0]):
+            lo[i] = mean[i] - std[i]
+            hi[i] = mean[i] + std[i]
+        return lo, hi
 
 
 def plot_data_inalist(
@@ -46,11 +69,17 @@ def plot_data_inalist(
         savedpi (int, optinal): Control the DPI for saved plot.
     """
 
-    sns.set_theme(style=style, font_scale=font_scale)
-    palette = sns.color_palette(palette, n_colors=len(mean_np))
+    set_theme_once(style=style, font_scale=font_scale)
+    palette = color_palette(palette, len(mean_np))
 
     if x is None:
-        x = [np.arange(len(mean)) for mean in mean_np]
+        # equal-length lines (the usual case) share one x array
+        lengths = {len(mean) for mean in mean_np}
+        if len(lengths) == 1:
+            shared_x = np.arange(lengths.pop())
+            x = [shared_x] * len(mean_np)
+        else:
+            x = [np.arange(len(mean)) for mean in mean_np]
 
     plt.figure(figsize=figsize)
 
@@ -64,7 +93,15 @@ def plot_data_inalist(
 
         if fill_between and std_np is not None and i < len(std_np):
             std = std_np[i]
-            plt.fill_between(x_vals, mean - std, mean + std, alpha=0.3)
+            use_numba = numba is not None and np.ndim(mean) == 1
+            if use_numba and np.shape(mean) == np.shape(std):
+                lower, upper = _bands(
+                    np.ascontiguousarray(mean, dtype=np.float64),
+                    np.ascontiguousarray(std, dtype=np.float64),
+                )
+            else:
+                lower, upper = _bands_numpy(mean, std)  # also covers broadcasting
+            plt.fill_between(x_vals, lower, upper, alpha=0.3)
 
     if despine:
         sns.despine(top=True, right=True)
@@ -75,6 +112,7 @@ def plot_data_inalist(
         plt.legend()
 
     if fname:
+        rasterize_long_lines(fname)
         plt.savefig(fname, bbox_inches="tight", dpi=savedpi)
 
     if show_plot:
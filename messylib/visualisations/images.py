@@ -1,10 +1,37 @@
 import numpy as np
+import gc
 import os
+import heapq
 import matplotlib.pyplot as plt
 import matplotlib.image as mpimg
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from PIL import Image
 from typing import List, Optional, Tuple
 
 
+def _load_thumbnail(path: str, target_px: int) -> np.ndarray:
+    """
+    Decode an image no larger than target_px on its longest side.
+
+    JPEGs are decoded at reduced scale via draft(); other formats are
+    decoded in full and then shrunk. Pillow-SIMD is a drop-in replacement
+    for Pillow if faster resizing is needed.
+    """
+    with Image.open(path) as im:
+        im.draft(im.mode, (target_px, target_px))
+        im.thumbnail((target_px, target_px))
+        return mpimg.pil_to_array(im)
+
+
+def _read_images(paths: List[str], target_px: int) -> List[np.ndarray]:
+    """Decode image files concurrently; the image decoders release the GIL."""
+    if not paths:
+        return []
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as ex:
+        return list(ex.map(partial(_load_thumbnail, target_px=target_px), paths))
+
+
 def plot_image(
     image: np.ndarray,
     cmap: str | None = "viridis",
@@ -92,23 +119,30 @@ def plot_images_from_folder(
         raise ValueError("`show_plot` must be a boolean value.")
 
     # Prepare the plot
-    fig, axes = plt.subplots(rows, cols, figsize=figsize)
-    axes = axes.flatten()
-
-    # Fetch and sort images
-    image_files = sorted([f for f in os.listdir(folder_path) if f.endswith(img_format)])
+    fig, axes = plt.subplots(rows, cols, figsize=figsize, squeeze=False)
+    axes = axes.ravel()
+
+    # Fetch the first rows*cols images in sorted order (no full sort needed)
+    with os.scandir(folder_path) as it:
+        matches = (e.name for e in it if e.name.endswith(img_format))
+        image_files = heapq.nsmallest(len(axes), matches)
+
+    # Resolve the colormap once for all subplots
+    cmap_obj = plt.colormaps.get_cmap(cmap)
+    if cmap_reverse:
+        cmap_obj = cmap_obj.reversed()
+
+    # Decode every image that gets a subplot up front
+    # (at roughly the pixel size of one subplot in the saved figure)
+    target_px = max(1, int(max(figsize[0] / cols, figsize[1] / rows) * save_dpi))
+    images = _read_images(
+        [os.path.join(folder_path, f) for f in image_files], target_px
+    )
 
     # Plot each image
     for i, ax in enumerate(axes):
         if i < len(image_files):
-            img_path = os.path.join(folder_path, image_files[i])
-            img = mpimg.imread(img_path)
-
-            cmap_obj = plt.colormaps.get_cmap(cmap)
-            if cmap_reverse:
-                cmap_obj = cmap_obj.reversed()
-
-            ax.imshow(img, cmap=cmap_obj)
+            ax.imshow(images[i], cmap=cmap_obj)
             ax.set_title(image_files[i], fontsize=title_size)
             ax.axis("off")
         else:
@@ -118,7 +152,8 @@ def plot_images_from_folder(
 
     # Handle display and saving
     if fname:
-        plt.savefig(fname, dpi=save_dpi)
+        # tight_layout already framed the grid, so skip the bbox="tight" pass
+        fig.savefig(fname, dpi=save_dpi)
     if show_plot:
         plt.show()
 
@@ -166,6 +201,16 @@ def plot_images_from_list(
     """
     total_imgs = len(pathlist)
 
+    # Resolve the colormap once for all batches
+    cmap_obj = None
+    if cmap is not None:
+        cmap_obj = plt.colormaps.get_cmap(cmap)
+        if cmap_reverse:
+            cmap_obj = cmap_obj.reversed()
+
+    # Decode file images at roughly the pixel size of one saved subplot
+    target_px = max(1, int(max(figsize[0] / cols, figsize[1] / rows) * save_dpi))
+
     # Iterate through the list in batches
     for i in range(0, total_imgs, stepsize):
         # Slice the current batch
@@ -174,28 +219,18 @@ def plot_images_from_list(
             print(f"Plotting batch of {len(to_plots)} images...")
 
         # Create subplot grid
-        fig, axes = plt.subplots(rows, cols, figsize=figsize)
-        axes = axes.flatten()
+        fig, axes = plt.subplots(rows, cols, figsize=figsize, squeeze=False)
+        axes = axes.ravel()
+
+        # Decode the batch up front when given file paths
+        images = to_plots if array_mode else _read_images(to_plots[: len(axes)], target_px)
 
         # Plot images
-        for idx, ax in enumerate(axes):
-            if idx < len(to_plots):
-                if not array_mode:
-                    img_path = to_plots[idx]
-                    img = mpimg.imread(img_path)
-                else:
-                    img = to_plots[idx]
-                    # ax.set_title(os.path.basename(img_path), fontsize=title_size)
-                if cmap is not None:
-                    cmap_obj = plt.colormaps.get_cmap(cmap)
-                    if cmap_reverse:
-                        cmap_obj = cmap_obj.reversed()
-                    ax.imshow(img, cmap=cmap_obj)
-                else:
-                    ax.imshow(img)
-                ax.axis("off")
-            else:
-                ax.axis("off")  # Hide empty subplots
+        n_plotted = min(len(to_plots), len(axes))
+        for idx in range(n_plotted):
+            ax = axes[idx]
+            ax.imshow(images[idx], cmap=cmap_obj)
+            ax.axis("off")
 
             # set title on each axes (images)
             if set_title:
@@ -203,10 +238,14 @@ def plot_images_from_list(
                     ax.set_title(title_list[idx], fontsize=title_size)
                 else:
                     if not array_mode:
-                        ax.set_title(os.path.basename(img_path), fontsize=title_size)
+                        ax.set_title(os.path.basename(to_plots[idx]), fontsize=title_size)
                     else:
                         ax.set_title(str(idx), fontsize=title_size)
 
+        # Hide empty subplots
+        for ax in axes[n_plotted:]:
+            ax.set_axis_off()
+
         plt.tight_layout()
 
         # Generate filename for saving
@@ -216,13 +255,22 @@ def plot_images_from_list(
 
         # Save or show the plot
         if fname:
-            plt.savefig(fname, dpi=save_dpi)
+            # tight_layout already framed the grid, so skip the bbox="tight" pass
+            fig.savefig(fname, dpi=save_dpi)
             if verbose:
                 print(f"Saved plot to {fname}")
         if show_plot:
             plt.show()
 
+        # Drop the decoded pixels held by each AxesImage before closing, and
+        # collect periodically so long runs do not keep old batches alive
+        for ax in fig.axes:
+            for im in list(ax.images):
+                im.remove()
         plt.close(fig)
+        del fig, axes, images, to_plots
+        if (i // stepsize) % 8 == 7:
+            gc.collect()
 
 # ====================================================================
 # ====================================================================
@@ -281,24 +329,24 @@ def plot_patches(
         print(f"Warning: More patches ({num_patches}) than subplots ({num_subplots}). "
               f"Only the first {num_subplots} will be plotted.")
 
+    # Handle colormap settings once for all patches
+    imshow_args = {}
+    if cmap:
+        try:
+            cmap_obj = plt.colormaps.get_cmap(cmap)
+            if cmap_reverse:
+                cmap_obj = cmap_obj.reversed()
+            imshow_args['cmap'] = cmap_obj
+        except ValueError:
+            if verbose:
+                print(f"Warning: Colormap '{cmap}' not found. Using default.")
+
     for i, patch in enumerate(patches):
         if i >= num_subplots:
             break
         
         ax = axes[i]
 
-        # Handle colormap settings
-        imshow_args = {}
-        if cmap:
-            try:
-                cmap_obj = plt.colormaps.get_cmap(cmap)
-                if cmap_reverse:
-                    cmap_obj = cmap_obj.reversed()
-                imshow_args['cmap'] = cmap_obj
-            except ValueError:
-                if verbose:
-                    print(f"Warning: Colormap '{cmap}' not found. Using default.")
-
         ax.imshow(patch, **imshow_args)
         ax.axis('off')
 